@@ -1,7 +1,9 @@
 from src.chess_viewer import ChessViewer
+from src.utils import configure_logging
 import tkinter as tk
 
 def main():
+    configure_logging()
     print("Starting application...")
     root = tk.Tk()
     print("Created root window")
@@ -39,6 +39,10 @@ def format_game_display(game_data: Dict) -> str:
         
     return " ".join(display)
 
+def game_list_text(white: str, black: str, result: str) -> str:
+    """Format a game's entry in the game list."""
+    return f"{white} vs {black} ({result})"
+
 def get_result_score(result: str) -> float:
     """Convert chess result string to numerical score."""
     result_map = {
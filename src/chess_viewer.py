@@ -5,27 +5,149 @@ from PIL import Image, ImageTk, ImageDraw
 import chess
 import chess.pgn
 import io
+import itertools
 import os
+import threading
 from .chess_database import ChessDatabase
-from .pgn_parser import PGNParser
-from .chess_utils import format_game_display, parse_elo
+from .pgn_parser import PGNParser, MovesOnlyVisitor
+from .chess_utils import format_game_display, game_list_text, parse_elo
+from .utils import available_memory_mb, configure_logging, discover_engines
 import xml.etree.ElementTree as ET
 from wand.image import Image as WandImage
 import numpy as np
 from scipy import ndimage
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('chess_parser.log'),
-        logging.StreamHandler()
-    ]
-)
+try:
+    import cv2  # Optional: much faster binary morphology on small masks
+except ImportError:
+    cv2 = None
+
+# Logging is set up by the application via configure_logging()
 logger = logging.getLogger(__name__)
 
+# Delay before loading a game picked with prev/next, so key repeat coalesces
+GAME_SWITCH_DELAY_MS = 50
+
+# Quiet period after the last <Configure> event before the board is resized
+RESIZE_DELAY_MS = 80
+
+# Games added to the listbox between UI refreshes while streaming a file
+LISTBOX_BATCH_SIZE = 500
+
+# Largest single Listbox.insert when filling from an in-memory list
+LISTBOX_INSERT_CHUNK = 10000
+
+# Piece image key ('wK', 'bP', ...) indexed by piece_type * 2 + color
+PIECE_KEYS = [None, None] + [
+    ('w' if color else 'b') + chess.piece_symbol(piece_type).upper()
+    for piece_type in chess.PIECE_TYPES
+    for color in (chess.BLACK, chess.WHITE)
+]
+
+# Top-left corner of each piece in the 270x90 sprite sheet
+PIECE_SPRITE_POSITIONS = {
+    'wK': (0, 0),    'wQ': (45, 0),   'wB': (90, 0),
+    'wN': (135, 0),  'wR': (180, 0),  'wP': (225, 0),
+    'bK': (0, 45),   'bQ': (45, 45),  'bB': (90, 45),
+    'bN': (135, 45), 'bR': (180, 45), 'bP': (225, 45)
+}
+
+# Square sizes pieces are pre-rendered at; the board snaps to one of these
+PIECE_SQUARE_SIZES = (32, 40, 48, 56, 64, 80, 96, 128)
+
+# Structuring elements for piece outline morphology
+CROSS_STRUCTURE = np.array([[0, 1, 0],
+                            [1, 1, 1],
+                            [0, 1, 0]], dtype=np.uint8)
+SQUARE_STRUCTURE = np.ones((3, 3), dtype=np.uint8)
+
+def _dilate(mask, structure=CROSS_STRUCTURE, iterations=1):
+    """Binary dilation of a boolean mask, treating pixels outside it as background."""
+    if cv2 is not None:
+        return cv2.dilate(mask.view(np.uint8), structure, iterations=iterations,
+                          borderType=cv2.BORDER_CONSTANT, borderValue=0).view(bool)
+    return ndimage.binary_dilation(mask, structure=structure, iterations=iterations)
+
+def _erode(mask, structure=CROSS_STRUCTURE, iterations=1):
+    """Binary erosion of a boolean mask, treating pixels outside it as background."""
+    if cv2 is not None:
+        return cv2.erode(mask.view(np.uint8), structure, iterations=iterations,
+                         borderType=cv2.BORDER_CONSTANT, borderValue=0).view(bool)
+    return ndimage.binary_erosion(mask, structure=structure, iterations=iterations)
+
+def _fill_holes(mask):
+    """Fill enclosed background regions of a 2D boolean mask."""
+    if cv2 is not None:
+        # Flood the 4-connected background in from a one-pixel border; anything unreached is inside
+        padded = np.zeros((mask.shape[0] + 2, mask.shape[1] + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = mask
+        cv2.floodFill(padded, None, (0, 0), 2, flags=4)
+        return padded[1:-1, 1:-1] != 2
+    return ndimage.binary_fill_holes(mask)
+
+def _build_piece_rgba(data, is_black, is_pawn):
+    """Recolour a sprite slice into a solid black/white piece with an outline mask.
+    
+    data is an RGBA uint8 array and is modified in place.
+    """
+    rgb = data[..., :3]
+    
+    # Find the piece shape (same threshold for both colors)
+    piece_shape = ~(rgb > 250).all(axis=2)
+    
+    # Fill the piece interior
+    filled_shape = _fill_holes(piece_shape)
+    
+    # Create stronger outer border (two iterations)
+    dilated = _dilate(filled_shape, iterations=2)
+    outer_border = dilated & ~filled_shape
+    
+    if is_pawn:
+        # For pawns, only keep the outer border
+        if is_black:
+            # Black pawns should be solid black
+            black_areas = filled_shape
+            white_areas = np.zeros_like(filled_shape, dtype=bool)
+        else:
+            # White pawns
+            black_areas = outer_border
+            white_areas = filled_shape & ~outer_border
+    else:
+        # For other pieces, process internal lines
+        # Use same threshold for both colors
+        dark_lines = (rgb < 64).all(axis=2)
+        light_lines = (rgb > 210).all(axis=2)  # Slightly lower threshold
+        
+        eroded_shape = _erode(filled_shape, iterations=4)
+        
+        # Process lines with slightly stronger dilation
+        if is_black:
+            light_lines = _dilate(light_lines, SQUARE_STRUCTURE)
+        dark_lines = _dilate(dark_lines, CROSS_STRUCTURE)
+        
+        interior_dark_lines = dark_lines & eroded_shape
+        interior_light_lines = light_lines & eroded_shape
+        
+        if is_black:
+            black_areas = filled_shape & ~interior_light_lines
+            white_areas = interior_light_lines
+        else:
+            black_areas = outer_border | interior_dark_lines
+            white_areas = filled_shape & ~black_areas
+    
+    # Set colors
+    data[black_areas,0:3] = 0    # Pure black
+    data[white_areas,0:3] = 255  # Pure white
+    
+    # Use the dilated shape as the mask. Alpha is all-or-nothing, so the
+    # premultiplied form just zeroes the colour of transparent pixels
+    mask = dilated
+    data[~mask] = 0
+    data[mask, 3] = 255
+    
+    return data
+
 class ChessViewer(tk.Frame):
     def __init__(self, root):
         print("Initializing ChessViewer...")
@@ -65,6 +187,8 @@ class ChessViewer(tk.Frame):
                 'text_fg': 'black',
                 'button_bg': '#e0e0e0',
                 'button_fg': 'black',
+                'highlight_bg': '#f6e58d',  # Current move in the moves list
+                'highlight_fg': 'black',
                 'listbox_bg': 'white',
                 'listbox_fg': 'black',
                 'frame_bg': '#f0f0f0',
@@ -82,6 +206,8 @@ class ChessViewer(tk.Frame):
                 'text_fg': '#ffffff',
                 'button_bg': '#383838',     # Dark buttons
                 'button_fg': '#ffffff',
+                'highlight_bg': '#4a7ab5',  # Current move, stands out from text_bg
+                'highlight_fg': '#ffffff',
                 'listbox_bg': '#2d2d2d',    # Dark listbox
                 'listbox_fg': '#ffffff',
                 'frame_bg': '#1e1e1e',      # Dark frames
@@ -106,9 +232,16 @@ class ChessViewer(tk.Frame):
         # Initialize variables
         self.current_game = None
         self.current_move_index = 0
+        self.moves = []  # Mainline moves of the current game
+        self.san_moves = []  # SAN of self.moves
+        self._boards_cache = [chess.Board()]  # Position after each ply of the current game
         self.games_list = []
-        self.piece_images = {}
-        self.square_size = 45
+        self._game_cache = {}  # id(game) -> prepared game, see _prepare_game
+        self._game_switch_after_id = None
+        self._piece_pyramid = {}  # square_size -> {piece_key: PhotoImage}
+        self.piece_images = {}  # Pieces at the current square size
+        self._sprite_master = None  # (piece_size, RGBA array of the rasterised sprite)
+        self.square_size = 48  # Always one of PIECE_SQUARE_SIZES
         self.light_squares = '#F0D9B5'
         self.dark_squares = '#B58863'
         self.board = chess.Board()
@@ -123,10 +256,27 @@ class ChessViewer(tk.Frame):
         self.max_lines = 5  # Maximum number of lines
         self.eval_var = tk.StringVar(value="")
         self.analysis_lines = []  # Store multiple analysis lines
+        self._analysis_thread = None
+        self._analysis_generation = 0  # Bumped to cancel in-flight analysis
+        self._engine_ready = threading.Event()  # Cleared while an engine starts up
+        self._engine_ready.set()
+        self._engine_token = 0  # Bumped per engine start; only the latest start may publish
+        self._analyze_when_ready = False  # Start analysis once the warming engine is up
         
         # Initialize board offsets
         self.board_x_offset = 0  # Will be updated in resize_board
         self.board_y_offset = 0  # Will be updated in resize_board
+        self._square_items = []  # Canvas ids of the 64 squares
+        self._square_centers = []  # Canvas (x, y) of each chess.SQUARES entry
+        self._piece_items = {}  # Square -> canvas image id of the piece drawn there
+        self._piece_keys = {}  # Square -> piece key currently drawn there
+        self._pieces_layout = None
+        self._resize_after_id = None
+        self._pieces_preloading = False  # Set once the piece preload thread is started
+        self._canvas_width = 0  # Canvas size from the last <Configure> event
+        self._canvas_height = 0
+        self._last_geom = None
+        self._last_colors = None
         
         print("Creating menu...")
         self.create_menu()
@@ -134,11 +284,10 @@ class ChessViewer(tk.Frame):
         print("Setting up GUI...")
         self.setup_gui()
         
-        print("Creating pieces...")
-        self.create_default_pieces()
+        # Pieces are preloaded once the first resize has picked the square size
         
         print("Drawing board...")
-        self.draw_board()
+        self._draw_static_layer()
         
         # Open most recent PGN file
         self.open_most_recent_pgn()
@@ -284,6 +433,11 @@ class ChessViewer(tk.Frame):
                 selectbackground=theme['button_bg'],
                 selectforeground=theme['button_fg']
             )
+            self.moves_text.tag_configure(
+                "current_move",
+                background=theme['highlight_bg'],
+                foreground=theme['highlight_fg']
+            )
         
         if hasattr(self, 'game_listbox'):
             self.game_listbox.configure(
@@ -304,6 +458,7 @@ class ChessViewer(tk.Frame):
         # Redraw the board if it exists
         if hasattr(self, 'canvas'):
             self.canvas.configure(bg=theme['bg'])
+            self._draw_static_layer()
             self.update_pieces()
         
         # Configure analysis text specifically
@@ -414,123 +569,17 @@ class ChessViewer(tk.Frame):
     def create_default_pieces(self):
         print("Starting create_default_pieces...")
         try:
-            from wand.image import Image as WandImage
-            import io
-            import numpy as np
-            from scipy import ndimage
-            
-            # Calculate the size we want for each piece (90% of square size)
-            piece_size = int(self.square_size * 0.9)
-            
-            # Piece positions in the sprite (x, y)
-            piece_positions = {
-                'wK': (0, 0),    'wQ': (45, 0),   'wB': (90, 0),
-                'wN': (135, 0),  'wR': (180, 0),  'wP': (225, 0),
-                'bK': (0, 45),   'bQ': (45, 45),  'bB': (90, 45),
-                'bN': (135, 45), 'bR': (180, 45), 'bP': (225, 45)
+            # Reuse pieces already rendered at this square size
+            self.piece_images = self._piece_pyramid.setdefault(self.square_size, {})
+            missing = {
+                piece_key: position
+                for piece_key, position in PIECE_SPRITE_POSITIONS.items()
+                if piece_key not in self.piece_images
             }
             
-            # Load the sprite sheet
-            with WandImage(filename='res/chess_pieces_sprite.svg') as sprite:
-                # Process each piece
-                for piece_key, (x, y) in piece_positions.items():
-                    # print(f"Creating piece {piece_key}...")
-                    # logger.info(f"Creating piece {piece_key}...")
-                    
-                    # Clone the sprite to avoid modifying the original
-                    with sprite.clone() as piece:
-                        # Crop to the piece location
-                        piece.crop(x, y, x + 45, y + 45)
-                        
-                        # Resize to desired size
-                        piece.resize(piece_size, piece_size)
-                        
-                        # Convert to PNG
-                        piece.format = 'png'
-                        png_data = piece.make_blob()
-                    
-                    # Create PIL Image from PNG data
-                    img = Image.open(io.BytesIO(png_data))
-                    img = img.convert('RGBA')
-                    
-                    # Convert to numpy array for easier processing
-                    data = np.array(img)
-                    
-                    # Find the piece shape (same threshold for both colors)
-                    piece_shape = ~((data[:,:,0] > 250) & (data[:,:,1] > 250) & (data[:,:,2] > 250))
-                    
-                    # Fill the piece interior
-                    filled_shape = ndimage.binary_fill_holes(piece_shape)
-                    
-                    # Create stronger outer border (two iterations)
-                    dilated = ndimage.binary_dilation(filled_shape, iterations=2)
-                    outer_border = dilated & ~filled_shape
-                    
-                    if piece_key.endswith('P'):
-                        # For pawns, only keep the outer border
-                        if piece_key.startswith('b'):
-                            # Black pawns should be solid black
-                            black_areas = filled_shape
-                            white_areas = np.zeros_like(filled_shape, dtype=bool)
-                        else:
-                            # White pawns
-                            black_areas = outer_border
-                            white_areas = filled_shape & ~outer_border
-                    else:
-                        # For other pieces, process internal lines
-                        # Use same threshold for both colors
-                        dark_lines = (data[:,:,0] < 64) & (data[:,:,1] < 64) & (data[:,:,2] < 64)
-                        light_lines = (data[:,:,0] > 210) & (data[:,:,1] > 210) & (data[:,:,2] > 210)  # Slightly lower threshold
-                        
-                        eroded_shape = ndimage.binary_erosion(filled_shape, iterations=4)
-                        
-                        # Process lines with slightly stronger dilation
-                        if piece_key.startswith('b'):
-                            light_lines = ndimage.binary_dilation(light_lines, iterations=1,
-                                                                structure=np.array([[1,1,1],
-                                                                                  [1,1,1],
-                                                                                  [1,1,1]]))
-                        dark_lines = ndimage.binary_dilation(dark_lines, iterations=1,
-                                                           structure=np.array([[0,1,0],
-                                                                             [1,1,1],
-                                                                             [0,1,0]]))
-                        
-                        interior_dark_lines = dark_lines & eroded_shape
-                        interior_light_lines = light_lines & eroded_shape
-                        
-                        if piece_key.startswith('b'):
-                            black_areas = filled_shape & ~interior_light_lines
-                            white_areas = interior_light_lines
-                        else:
-                            black_areas = outer_border | interior_dark_lines
-                            white_areas = filled_shape & ~black_areas
-                    
-                    # Set colors
-                    data[black_areas,0:3] = 0    # Pure black
-                    data[white_areas,0:3] = 255  # Pure white
-                    
-                    # Use the dilated shape as the mask
-                    mask = dilated
-                    data[:,:,3] = np.where(mask, 255, 0)
-                    
-                    # Create PIL Image from numpy array
-                    img = Image.fromarray(data)
-                    
-                    # Create a new image with the square size dimensions
-                    final_img = Image.new('RGBA', (self.square_size, self.square_size), (0, 0, 0, 0))
-                    
-                    # Calculate position to paste (center the piece)
-                    paste_x = (self.square_size - piece_size) // 2
-                    paste_y = (self.square_size - piece_size) // 2
-                    
-                    # Paste the piece onto the center of the square
-                    final_img.paste(img, (paste_x, paste_y))
-                    
-                    # Create PhotoImage
-                    self.piece_images[piece_key] = ImageTk.PhotoImage(final_img)
-                    
-                    # print(f"Created piece {piece_key}")
-                    # logger.info(f"Created piece {piece_key}")
+            if missing:
+                arrays = self._compute_piece_arrays(self.square_size, missing)
+                self._finalize_piece_images(arrays, self.square_size)
                 
         except Exception as e:
             print(f"Error creating pieces: {e}")
@@ -539,12 +588,106 @@ class ChessViewer(tk.Frame):
         
         print("Finished create_default_pieces")
 
-    def draw_board(self):
-        """Draw the chess board."""
-        # Clear existing squares
-        self.canvas.delete("square")
+    def _preload_pieces(self):
+        """Render every piece size on a worker thread; the board starts out empty."""
+        self.piece_images = self._piece_pyramid.setdefault(self.square_size, {})
+        
+        # Current size first so the opening position appears as soon as possible
+        sizes = [self.square_size]
+        sizes += [size for size in PIECE_SQUARE_SIZES if size != self.square_size]
+        threading.Thread(
+            target=self._preload_pieces_worker,
+            args=(sizes,),
+            daemon=True
+        ).start()
+
+    def _preload_pieces_worker(self, sizes):
+        """Compute piece arrays off the Tk main thread and hand them back to it."""
+        try:
+            for square_size in sizes:
+                arrays = self._compute_piece_arrays(square_size, PIECE_SPRITE_POSITIONS)
+                self.after(0, self._on_pieces_preloaded, arrays, square_size)
+        except Exception as e:
+            logger.error(f"Error creating pieces: {e}")
+
+    def _on_pieces_preloaded(self, arrays, square_size):
+        """Turn preloaded piece arrays into images and draw them (main thread)."""
+        self._finalize_piece_images(arrays, square_size)
+        if square_size == self.square_size:
+            self.update_pieces()
+
+    def _compute_piece_arrays(self, square_size, positions):
+        """Render the pieces in positions as square-sized RGBA arrays; no Tk calls."""
+        # Calculate the size we want for each piece (90% of square size)
+        piece_size = int(square_size * 0.9)
+        
+        # Rasterise the sprite sheet once per piece size
+        master = self._get_sprite_master(piece_size)
+        
+        arrays = {}
+        for piece_key, (x, y) in positions.items():
+            # Slice the piece out of the rasterised sprite (45px cells in the SVG)
+            x0 = (x // 45) * piece_size
+            y0 = (y // 45) * piece_size
+            data = master[y0:y0 + piece_size, x0:x0 + piece_size].copy()
+            
+            data = _build_piece_rgba(
+                data,
+                is_black=piece_key.startswith('b'),
+                is_pawn=piece_key.endswith('P')
+            )
+            
+            # Centre the piece in a transparent square-sized border
+            pad = (square_size - piece_size) // 2
+            pad_end = square_size - piece_size - pad
+            arrays[piece_key] = np.pad(data, ((pad, pad_end), (pad, pad_end), (0, 0)))
         
-        # Draw new squares
+        return arrays
+
+    def _finalize_piece_images(self, arrays, square_size):
+        """Create PhotoImages from piece arrays (must run on the Tk main thread)."""
+        images = self._piece_pyramid.setdefault(square_size, {})
+        for piece_key, data in arrays.items():
+            # Never replace an image the canvas may still be showing
+            if piece_key not in images:
+                images[piece_key] = ImageTk.PhotoImage(Image.fromarray(data))
+
+    def _get_sprite_master(self, piece_size):
+        """Return the sprite sheet rasterised at piece_size as an RGBA array."""
+        # Read the shared cache once; the worker thread and a resize may both be here
+        cached = self._sprite_master
+        if cached is not None and cached[0] == piece_size:
+            return cached[1]
+        
+        with WandImage(filename='res/chess_pieces_sprite.svg') as sprite:
+            sprite.resize(6 * piece_size, 2 * piece_size)
+            sprite.format = 'png'
+            png_data = sprite.make_blob()
+        master = np.array(Image.open(io.BytesIO(png_data)).convert('RGBA'))
+        self._sprite_master = (piece_size, master)
+        return master
+
+    def _draw_static_layer(self):
+        """Draw the board squares, touching them only when geometry or colours changed.
+        
+        Navigation never comes through here; it only updates the piece layer.
+        """
+        geometry = (self.square_size, self.board_x_offset, self.board_y_offset)
+        colors = (self.light_squares, self.dark_squares)
+        if geometry == self._last_geom and colors == self._last_colors:
+            return
+        
+        if geometry != self._last_geom:
+            # Piece anchor points, indexed by chess square
+            half = self.square_size // 2
+            self._square_centers = [
+                (self.board_x_offset + chess.square_file(square) * self.square_size + half,
+                 self.board_y_offset + (7 - chess.square_rank(square)) * self.square_size + half)
+                for square in chess.SQUARES
+            ]
+        
+        # Create the squares once, afterwards only move/recolour them
+        create = not self._square_items
         for row in range(8):
             for col in range(8):
                 x1 = self.board_x_offset + (col * self.square_size)
@@ -555,13 +698,23 @@ class ChessViewer(tk.Frame):
                 # Determine square color
                 color = self.light_squares if (row + col) % 2 == 0 else self.dark_squares
                 
-                # Create square
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill=color,
-                    outline="",
-                    tags="square"
-                )
+                if create:
+                    self._square_items.append(self.canvas.create_rectangle(
+                        x1, y1, x2, y2,
+                        fill=color,
+                        outline="",
+                        tags="static"
+                    ))
+                    continue
+                
+                item = self._square_items[row * 8 + col]
+                if geometry != self._last_geom:
+                    self.canvas.coords(item, x1, y1, x2, y2)
+                if colors != self._last_colors:
+                    self.canvas.itemconfig(item, fill=color)
+        
+        self._last_geom = geometry
+        self._last_colors = colors
 
     def start_play_mode(self, engine_path, engine_depth):
         """Initialize play mode."""
@@ -587,14 +740,23 @@ class ChessViewer(tk.Frame):
             if not filename:
                 return
                 
-            # Parse PGN file
+            # Stream games from the PGN file into the list
             parser = PGNParser()
-            games = parser.parse_file(filename)
+            games = parser.iter_games(filename)
             
-            if games:
-                logger.info(f"Parsed {len(games)} games from {filename}")
-                self.add_games_to_list(games)
-            else:
+            loaded = 0
+            first_game = next(games, None)
+            if first_game is not None:
+                self.add_games_to_list(itertools.chain([first_game], games))
+                loaded = len(self.games_list)
+            
+            # The generator records read errors instead of raising them
+            if parser.errors:
+                messagebox.showwarning(
+                    "Warning",
+                    f"Stopped reading after {loaded} games:\n{parser.errors[-1]}"
+                )
+            elif not loaded:
                 messagebox.showwarning("Warning", "No games found in file")
                 
         except Exception as e:
@@ -652,17 +814,13 @@ class ChessViewer(tk.Frame):
                 messagebox.showinfo("Info", "No games found in database")
                 return
                 
-            self.games_list = []
+            self._cancel_game_switch()
+            self.games_list = list(games)
+            self._game_cache.clear()
             self.game_listbox.delete(0, tk.END)
             
-            for game in games:
-                # The last two columns are white_name and black_name from our JOINs
-                white_name = game[-2]  # Second to last column
-                black_name = game[-1]  # Last column
-                display_text = f"{white_name} vs {black_name}"
-                
-                self.game_listbox.insert(tk.END, display_text)
-                self.games_list.append(game)
+            # The last two columns are white_name and black_name from our JOINs
+            self._fill_listbox([f"{game[-2]} vs {game[-1]}" for game in games])
                 
         except Exception as e:
             messagebox.showerror("Error", f"Error opening database: {str(e)}")
@@ -708,13 +866,12 @@ class ChessViewer(tk.Frame):
             
         try:
             games = self.db.search_games(search_term)
-            self.games_list = []
+            self._cancel_game_switch()
+            self.games_list = list(games)
+            self._game_cache.clear()
             self.game_listbox.delete(0, tk.END)
             
-            for game in games:
-                game_str = self.format_game_display(game)
-                self.game_listbox.insert(tk.END, game_str)
-                self.games_list.append(game)
+            self._fill_listbox([self.format_game_display(game) for game in games])
                 
         except Exception as e:
             messagebox.showerror("Error", f"Search error: {str(e)}")
@@ -730,8 +887,7 @@ class ChessViewer(tk.Frame):
             # Adjust canvas size if needed
             if hasattr(self, 'canvas'):
                 self.canvas.configure(width=event.width, height=event.height)
-                self.draw_board()  # Only redraw the board, don't reset position
-                self.update_pieces()  # Keep the current position
+                # The canvas <Configure> that follows schedules the board redraw
 
     # Navigation methods
     def first_move(self):
@@ -745,17 +901,7 @@ class ChessViewer(tk.Frame):
             return
             
         try:
-            if isinstance(self.current_game, dict):
-                pgn_str = self.current_game.get('pgn', '')
-                if pgn_str:
-                    game = chess.pgn.read_game(io.StringIO(pgn_str))
-                    if game:
-                        moves = list(game.mainline_moves())
-                        self.current_move_index = len(moves)
-            else:
-                moves = list(self.current_game.mainline_moves())
-                self.current_move_index = len(moves)
-                
+            self.current_move_index = len(self.moves)
             self.update_pieces()
             
         except Exception as e:
@@ -767,30 +913,10 @@ class ChessViewer(tk.Frame):
             return
         
         try:
-            # Get moves list
-            if isinstance(self.current_game, dict):
-                pgn_str = self.current_game.get('pgn', '')
-                if not pgn_str:
-                    logger.warning("No moves found in game")
-                    return
-                    
-                # Create a StringIO object with the PGN text
-                pgn_io = io.StringIO(pgn_str)
-                game = chess.pgn.read_game(pgn_io)
-                
-                if game:
-                    moves = list(game.mainline_moves())
-                else:
-                    logger.warning("Could not parse moves for navigation")
-                    return
-            else:
-                moves = list(self.current_game.mainline_moves())
-            
             # Check if we can move forward
-            if self.current_move_index < len(moves):
+            if self.current_move_index < len(self.moves):
                 self.current_move_index += 1
                 self.update_pieces()
-                self.update_moves_display()
             
         except Exception as e:
             logger.error(f"Error applying moves: {e}")
@@ -801,176 +927,171 @@ class ChessViewer(tk.Frame):
             self.update_pieces()
 
     def on_select_game(self, event):
+        self._cancel_game_switch()
         selection = self.game_listbox.curselection()
         if selection:
             self.current_game = self.games_list[selection[0]]
             self.current_move_index = 0
-            self.update_game_info()
-            self.update_pieces()
+            self.update_game_info()  # Also draws the pieces
 
     def resize_board(self, event):
-        """Handle board resize while maintaining square aspect ratio."""
+        """Schedule a board resize; bursts of <Configure> events collapse into one."""
         if event.widget == self.canvas:
-            # Get the container size
-            width = self.board_container.winfo_width()
-            height = self.board_container.winfo_height()
-            
-            # Calculate the maximum possible board size that fits while maintaining aspect ratio
-            board_size = min(width - 20, height - 20)  # Subtract padding
-            
-            # Calculate new square size
-            self.square_size = max(30, board_size // 8)  # Minimum square size of 30 pixels
-            
-            # Recalculate board size to ensure it's exactly 8 squares
-            board_size = self.square_size * 8
-            
-            # Center the board in the canvas
-            x_offset = (width - board_size) // 2
-            y_offset = (height - board_size) // 2
-            
-            # Store offsets for piece placement
-            self.board_x_offset = x_offset
-            self.board_y_offset = y_offset
-            
-            # Recreate piece images at new size
+            # The event carries the new size; no need to ask Tk for it later
+            self._canvas_width = event.width
+            self._canvas_height = event.height
+            if self._resize_after_id:
+                self.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.after(RESIZE_DELAY_MS, self._do_resize)
+
+    def _do_resize(self):
+        """Resize the board while maintaining square aspect ratio."""
+        self._resize_after_id = None
+        
+        # The canvas fills its container, so its last configured size is the container size
+        width = self._canvas_width
+        height = self._canvas_height
+        
+        # Calculate the maximum possible board size that fits while maintaining aspect ratio
+        board_size = min(width - 20, height - 20)  # Subtract padding
+        
+        # Snap down to the largest pre-rendered piece size that fits
+        fitting = [size for size in PIECE_SQUARE_SIZES if size <= board_size // 8]
+        square_size = fitting[-1] if fitting else PIECE_SQUARE_SIZES[0]
+        
+        # Recalculate board size to ensure it's exactly 8 squares
+        board_size = square_size * 8
+        
+        # Center the board in the canvas
+        x_offset = (width - board_size) // 2
+        y_offset = (height - board_size) // 2
+        
+        # Nothing to do if the board did not actually change
+        if self._pieces_preloading and (square_size, x_offset, y_offset) == (
+                self.square_size, self.board_x_offset, self.board_y_offset):
+            return
+        size_changed = square_size != self.square_size
+        
+        # Store size and offsets for piece placement
+        self.square_size = square_size
+        self.board_x_offset = x_offset
+        self.board_y_offset = y_offset
+        
+        if not self._pieces_preloading:
+            # First real layout: render this size first, off the main thread
+            self._pieces_preloading = True
+            print("Creating pieces...")
+            self._preload_pieces()
+        elif size_changed:
+            # Pieces are normally preloaded; this only renders if preloading is behind
             self.create_default_pieces()
-            
-            # Redraw everything
-            self.draw_board()
-            self.update_pieces()
+        
+        # Move the squares, then the pieces onto them
+        self._draw_static_layer()
+        self.update_pieces()
 
     def update_pieces(self):
         """Update piece positions on the board."""
         try:
-            # Clear existing pieces
-            self.canvas.delete("piece")
-            
-            # Get current position from moves
-            board = chess.Board()
+            # Positions are precomputed per ply when the game is selected
+            board = self._boards_cache[self.current_move_index]
             
-            if self.current_game:
-                # Handle database games (tuples)
-                if isinstance(self.current_game, tuple):
-                    pgn_str = self.current_game[11]  # pgn column
-                    if pgn_str:
-                        game = chess.pgn.read_game(io.StringIO(pgn_str))
-                        if game:
-                            moves = list(game.mainline_moves())
-                            for move in moves[:self.current_move_index]:
-                                board.push(move)
-                            
-                # Handle PGN-sourced games - keep original logic
-                elif isinstance(self.current_game, chess.pgn.Game):
-                    moves = list(self.current_game.mainline_moves())
-                    for move in moves[:self.current_move_index]:
-                        board.push(move)
+            # Keep the displayed position around for analysis
+            self.board = board
                 
-            # Convert board position to our format
-            position = [['.'] * 8 for _ in range(8)]
-            for square in chess.SQUARES:
-                piece = board.piece_at(square)
-                if piece:
-                    rank = chess.square_rank(square)
-                    file = chess.square_file(square)
-                    color = 'w' if piece.color else 'b'
-                    piece_type = piece.symbol().upper()
-                    position[7-rank][file] = color + piece_type
+            # Start over when the board was resized or moved
+            layout = (self.square_size, self.board_x_offset, self.board_y_offset)
+            if layout != self._pieces_layout:
+                self.canvas.delete("piece")
+                self._piece_items.clear()
+                self._piece_keys = {}
+                self._pieces_layout = layout
             
-            # Draw pieces in their current positions
-            for row in range(8):
-                for col in range(8):
-                    piece = position[row][col]
-                    if piece != '.':
-                        x = self.board_x_offset + (col * self.square_size) + (self.square_size // 2)
-                        y = self.board_y_offset + (row * self.square_size) + (self.square_size // 2)
-                        if piece in self.piece_images:
-                            self.canvas.create_image(
-                                x, y,
-                                image=self.piece_images[piece],
-                                tags="piece"
-                            )
+            new_keys = {}
+            for square, piece in board.piece_map().items():
+                key = PIECE_KEYS[piece.piece_type * 2 + piece.color]
+                if key in self.piece_images:
+                    new_keys[square] = key
+            
+            # Remove pieces from squares that are now empty
+            for square in self._piece_keys.keys() - new_keys.keys():
+                self.canvas.delete(self._piece_items.pop(square))
+            
+            # Draw or swap only the pieces that changed
+            for square, key in new_keys.items():
+                if self._piece_keys.get(square) == key:
+                    continue
+                item = self._piece_items.get(square)
+                if item is None:
+                    x, y = self._square_centers[square]
+                    self._piece_items[square] = self.canvas.create_image(
+                        x, y,
+                        image=self.piece_images[key],
+                        tags="piece"
+                    )
+                else:
+                    self.canvas.itemconfigure(item, image=self.piece_images[key])
+            self._piece_keys = new_keys
             
-            # Update moves display
-            self.update_moves_display()
+            # Mark the current move in the moves display
+            self._highlight_current_move()
             
         except Exception as e:
             logger.error(f"Error updating pieces: {e}")
 
-    def update_moves_display(self):
-        """Update the moves text display."""
+    def _render_moves_once(self):
+        """Fill the moves text for the current game; called when the game changes."""
         try:
             self.moves_text.delete('1.0', tk.END)
             
             if not self.current_game:
                 return
                 
-            # Get moves based on game type
-            moves = []
-            if isinstance(self.current_game, tuple):
-                # Database game
-                pgn_str = self.current_game[11]  # pgn column
-                if pgn_str:
-                    game = chess.pgn.read_game(io.StringIO(pgn_str))
-                    if game:
-                        moves = list(game.mainline_moves())
-            else:
-                # PGN game
-                moves = list(self.current_game.mainline_moves())
-            
-            # Format and display moves
-            board = chess.Board()
-            for i, move in enumerate(moves):
+            # Build (text, tags) pairs from the cached SAN and insert them
+            # in one call; clicks are handled by the "move" tag binding
+            chunks = []
+            for i, san in enumerate(self.san_moves):
                 # Add move number for white's moves
                 if i % 2 == 0:
-                    move_num = f"{i//2 + 1}. "
-                    self.moves_text.insert(tk.END, move_num)
-                
-                # Format the move
-                san = board.san(move)
-                if i == self.current_move_index - 1:
-                    san = f"[{san}]"
-                
-                # Insert move with tag and spacing
-                move_start = self.moves_text.index("end-1c")
-                self.moves_text.insert(tk.END, san)
-                move_end = self.moves_text.index("end-1c")
-                self.moves_text.tag_add("move", move_start, move_end)
-                self.moves_text.insert(tk.END, " ")
+                    chunks += [f"{i//2 + 1}. ", ()]
                 
-                # Store move index in tag
-                tag_name = f"move_{i}"
-                self.moves_text.tag_add(tag_name, move_start, move_end)
-                self.moves_text.tag_bind(tag_name, "<Button-1>", 
-                    lambda e, idx=i: self.goto_move(idx + 1))
-                
-                board.push(move)
+                # Move text carries its index in a move_<i> tag
+                chunks += [san, ("move", f"move_{i}"), " ", ()]
+            
+            if chunks:
+                self.moves_text.insert(tk.END, *chunks)
                 
         except Exception as e:
             logger.error(f"Error updating moves display: {e}")
 
+    def _highlight_current_move(self):
+        """Move the "current_move" tag onto the last played move."""
+        try:
+            self.moves_text.tag_remove("current_move", '1.0', tk.END)
+            if self.current_move_index <= 0:
+                return
+            
+            ranges = self.moves_text.tag_ranges(f"move_{self.current_move_index - 1}")
+            if ranges:
+                self.moves_text.tag_add("current_move", ranges[0], ranges[1])
+                self.moves_text.see(ranges[0])
+                
+        except Exception as e:
+            logger.error(f"Error highlighting current move: {e}")
+
     def goto_move(self, move_index):
         """Go to specific move number."""
         try:
             if move_index < 0:
                 move_index = 0
             
-            # Get total moves based on game type
-            total_moves = 0
-            if isinstance(self.current_game, tuple):
-                pgn_str = self.current_game[11]
-                if pgn_str:
-                    game = chess.pgn.read_game(io.StringIO(pgn_str))
-                    if game:
-                        total_moves = len(list(game.mainline_moves()))
-            else:
-                total_moves = len(list(self.current_game.mainline_moves()))
+            total_moves = len(self.moves)
             
             if move_index > total_moves:
                 move_index = total_moves
                 
             self.current_move_index = move_index
             self.update_pieces()
-            self.update_moves_display()
             
         except Exception as e:
             logger.error(f"Error going to move: {e}")
@@ -1002,50 +1123,165 @@ class ChessViewer(tk.Frame):
             self.info_text.delete('1.0', tk.END)
             self.info_text.insert('1.0', info_text)
             
-            # Get PGN moves
-            if isinstance(self.current_game, chess.pgn.Game):
-                # PGN-sourced game
-                self.moves = list(self.current_game.mainline_moves())
+            # Parse the game once; navigation reuses the prepared data
+            prepared = self._prepare_game(self.current_game)
+            self.moves = prepared['moves']
+            
+            # Precompute the position after every ply in one walk over the game,
+            # collecting SAN along the way the first time the game is shown
+            board = prepared['start'].copy(stack=False)
+            boards = [board.copy(stack=False)]
+            push, add_board = board.push, boards.append  # Hoisted out of the per-ply loop
+            if prepared['san'] is None:
+                san = []
+                add_san = san.append
+                for move in self.moves:
+                    add_san(board.san(move))
+                    push(move)
+                    add_board(board.copy(stack=False))
+                prepared['san'] = san
             else:
-                # Database-sourced game - parse PGN text
-                pgn_io = io.StringIO(self.current_game[11])  # pgn column
-                game = chess.pgn.read_game(pgn_io)
-                if game:
-                    self.moves = list(game.mainline_moves())
-                else:
-                    self.moves = []
-                    logger.error("Failed to parse PGN from database")
+                for move in self.moves:
+                    push(move)
+                    add_board(board.copy(stack=False))
+            self._boards_cache = boards
+            self.san_moves = prepared['san']
             
-            # Reset board
-            self.board.reset()
             self.current_move_index = 0
+            self._render_moves_once()
             self.update_pieces()
             
         except Exception as e:
             logger.error(f"Error updating game info: {e}")
             messagebox.showerror("Error", "Failed to update game information")
 
-    def initialize_engine(self):
-        """Initialize the chess engine."""
+    def _prepare_game(self, game):
+        """Return moves and start position for a game, built once per game.
+        
+        SAN is filled in by update_game_info while it walks the game.
+        """
+        key = id(game)
+        prepared = self._game_cache.get(key)
+        if prepared is not None:
+            return prepared
+        
+        moves = self._load_moves(game)
+        start = game.board() if isinstance(game, chess.pgn.Game) else chess.Board()
+        
+        prepared = {'moves': moves, 'san': None, 'start': start}
+        self._game_cache[key] = prepared
+        return prepared
+
+    def _load_moves(self, game):
+        """Return the mainline moves of a game, parsing stored PGN text if needed."""
+        if isinstance(game, chess.pgn.Game):
+            return list(game.mainline_moves())
+        
+        if not isinstance(game, tuple):
+            return []
+        
+        pgn_str = game[11]  # pgn column
+        
+        if not pgn_str:
+            logger.warning("No moves found in game")
+            return []
+        
+        moves = chess.pgn.read_game(io.StringIO(pgn_str), Visitor=MovesOnlyVisitor)
+        if moves is None:
+            logger.error("Failed to parse PGN moves")
+            return []
+        return moves
+
+    def initialize_engine(self, engine_path, token):
+        """Initialize the chess engine (runs on the warm-up thread started by _warm_engine)."""
         try:
-            if self.engine_path and os.path.exists(self.engine_path):
-                self.engine = chess.engine.SimpleEngine.popen_uci(self.engine_path)
-                logger.info(f"Successfully initialized engine: {self.engine_path}")
+            if engine_path and os.path.exists(engine_path):
+                engine = chess.engine.SimpleEngine.popen_uci(engine_path)
+                self._configure_engine(engine)
+                
+                # Another engine was started, or the app closed, while this one was starting
+                if token != self._engine_token or engine_path != self.engine_path:
+                    engine.quit()
+                    return
+                
+                self.engine = engine
+                logger.info(f"Successfully initialized engine: {engine_path}")
         except Exception as e:
             logger.error(f"Failed to initialize engine: {e}")
-            self.engine = None
+        finally:
+            # An older start finishing must not report a newer one as ready
+            if token == self._engine_token:
+                self._engine_ready.set()
+                self.after(0, self._on_engine_ready, token)
+
+    def _on_engine_ready(self, token):
+        """Start the analysis a click asked for while the engine was warming (Tk thread)."""
+        if token != self._engine_token or not self._analyze_when_ready:
+            return
+        self._analyze_when_ready = False
+        
+        if not self.engine:
+            self.analysis_text.delete('1.0', tk.END)
+            self.analysis_text.insert('1.0', "No engine available")
+            return
+        
+        if not self.analyzing:
+            self.analyzing = True
+            self.analyze_button.configure(text="stop")
+            self.analyze_position()
+
+    def _warm_engine(self):
+        """Start the selected engine in the background so the first analysis is instant."""
+        self._engine_token += 1
+        self._engine_ready.clear()
+        threading.Thread(
+            target=self.initialize_engine,
+            args=(self.engine_path, self._engine_token),
+            daemon=True
+        ).start()
+
+    def _configure_engine(self, engine):
+        """Give the engine all but one core and a quarter of free memory for its hash."""
+        options = {}
+        if 'Threads' in engine.options:
+            options['Threads'] = max(1, (os.cpu_count() or 1) - 1)
+        
+        available_mb = available_memory_mb()
+        if 'Hash' in engine.options and available_mb:
+            options['Hash'] = max(16, min(2048, available_mb // 4))
+        
+        for name, value in options.items():
+            option = engine.options[name]
+            if option.max is not None:
+                options[name] = min(value, option.max)
+        
+        if options:
+            engine.configure(options)
 
     def toggle_analysis(self):
         """Toggle engine analysis on/off."""
         if self.analyzing:
             self.analyzing = False
+            self._analyze_when_ready = False
+            self._analysis_generation += 1  # Tell the worker to stop
             self.analyze_button.configure(text="start")
             self.analysis_text.delete('1.0', tk.END)
             return
         
         if not self.engine:
-            self.initialize_engine()
+            # Never start an engine on the Tk thread; give a running warm-up a moment
+            ready = self._engine_ready.wait(timeout=0.2)
             if not self.engine:
+                # Only start a warm-up when none is running
+                if ready:
+                    if not self.engine_path or not os.path.exists(self.engine_path):
+                        self.analysis_text.delete('1.0', tk.END)
+                        self.analysis_text.insert('1.0', "No engine available")
+                        return
+                    self._warm_engine()
+                self._analyze_when_ready = True
+                self.analysis_text.delete('1.0', tk.END)
+                self.analysis_text.insert('1.0', "Engine warming, analysis will start shortly...")
                 return
         
         self.analyzing = True
@@ -1058,41 +1294,53 @@ class ChessViewer(tk.Frame):
             return
         
         try:
-            # Get current position
-            board = chess.Board()
-            
-            # Handle different game types
-            if isinstance(self.current_game, tuple):
-                # Database game
-                pgn_str = self.current_game[11]  # pgn column
-                if pgn_str:
-                    game = chess.pgn.read_game(io.StringIO(pgn_str))
-                    if game:
-                        moves = list(game.mainline_moves())
-                        for move in moves[:self.current_move_index]:
-                            board.push(move)
-            elif isinstance(self.current_game, dict):
-                # Dictionary-based game
-                game = chess.pgn.read_game(io.StringIO(self.current_game.get('pgn', '')))
-                if game:
-                    moves = list(game.mainline_moves())
-                    for move in moves[:self.current_move_index]:
-                        board.push(move)
-            else:
-                # PGN game - keep original logic
-                moves = list(self.current_game.mainline_moves())
-                for move in moves[:self.current_move_index]:
-                    board.push(move)
+            # Snapshot the displayed position instead of replaying the game
+            board = self.board.copy(stack=False)
             
             # Clear previous analysis
             self.analysis_text.delete('1.0', tk.END)
             
-            # Get analysis info
-            info = self.engine.analyse(
-                board,
-                chess.engine.Limit(depth=self.engine_depth),
-                multipv=self.num_lines
+            # Run the engine off the Tk main thread; any older run sees the
+            # new generation and stops itself
+            self._analysis_generation += 1
+            self._analysis_thread = threading.Thread(
+                target=self._analysis_worker,
+                args=(board, self.engine_depth, self.num_lines, self._analysis_generation),
+                daemon=True
             )
+            self._analysis_thread.start()
+            
+        except Exception as e:
+            logger.error(f"Analysis error: {e}")
+            self.analysis_text.delete('1.0', tk.END)
+            self.analysis_text.insert('1.0', f"Analysis error: {str(e)}")
+
+    def _analysis_worker(self, board, depth, num_lines, generation):
+        """Run engine analysis in a background thread and hand results to Tk."""
+        try:
+            with self.engine.analysis(
+                board,
+                chess.engine.Limit(depth=depth),
+                multipv=num_lines
+            ) as analysis:
+                for _ in analysis:
+                    if generation != self._analysis_generation:
+                        analysis.stop()
+                        return
+                info = analysis.multipv
+            
+            self.after(0, self._render_analysis, info, board, generation)
+            
+        except Exception as e:
+            self.after(0, self._render_analysis_error, e, generation)
+
+    def _render_analysis(self, info, board, generation):
+        """Display analysis lines (runs on the Tk main thread)."""
+        if not self.analyzing or generation != self._analysis_generation:
+            return
+        
+        try:
+            self.analysis_text.delete('1.0', tk.END)
             
             # Display each line of analysis
             for i, line in enumerate(info):
@@ -1114,9 +1362,15 @@ class ChessViewer(tk.Frame):
             self.analysis_text.see('1.0')  # Scroll to top
             
         except Exception as e:
-            logger.error(f"Analysis error: {e}")
-            self.analysis_text.delete('1.0', tk.END)
-            self.analysis_text.insert('1.0', f"Analysis error: {str(e)}")
+            self._render_analysis_error(e, generation)
+
+    def _render_analysis_error(self, error, generation):
+        """Show an analysis error (runs on the Tk main thread)."""
+        if generation != self._analysis_generation:
+            return
+        logger.error(f"Analysis error: {error}")
+        self.analysis_text.delete('1.0', tk.END)
+        self.analysis_text.insert('1.0', f"Analysis error: {str(error)}")
 
     def __del__(self):
         """Cleanup when object is destroyed."""
@@ -1126,44 +1380,20 @@ class ChessViewer(tk.Frame):
     def parse_pgn_moves(self, game_dict):
         """Convert PGN moves string into a chess.pgn.Game object."""
         try:
-            # Create a new game
-            game = chess.pgn.Game()
-            
-            # Set headers
-            for key, value in game_dict.items():
-                if key != 'moves':
-                    game.headers[key] = value
-            
-            # Clean up moves string
             moves_str = game_dict.get('moves', '').strip()
             if not moves_str:
                 logger.warning("No moves found in game")
                 return None
-                
-            # Create a board for parsing moves
-            board = chess.Board()
-            node = game
-            
-            # Clean up moves string and split into tokens
-            moves_str = moves_str.replace('  ', ' ')
-            tokens = moves_str.split()
             
-            current_move = []
-            for token in tokens:
-                # Skip move numbers and result
-                if '.' in token or token in ['1-0', '0-1', '1/2-1/2', '*']:
-                    continue
-                
-                try:
-                    # Parse move in standard algebraic notation
-                    move = board.parse_san(token)
-                    node = node.add_variation(move)
-                    board.push(move)
-                except Exception as e:
-                    logger.error(f"Error parsing move {token}: {e}")
-                    continue
+            # Rebuild a minimal PGN and let python-chess parse it
+            pgn_text = ''.join(
+                f'[{key} "{value}"]\n'
+                for key, value in game_dict.items()
+                if key not in ('moves', 'pgn')
+            )
+            pgn_text += '\n' + moves_str + '\n'
             
-            return game
+            return chess.pgn.read_game(io.StringIO(pgn_text))
             
         except Exception as e:
             logger.error(f"Error converting moves to game object: {e}")
@@ -1180,13 +1410,7 @@ class ChessViewer(tk.Frame):
         
         new_index = current_index[0] - 1
         if new_index >= 0:
-            self.game_listbox.selection_clear(0, tk.END)
-            self.game_listbox.selection_set(new_index)
-            self.game_listbox.see(new_index)
-            self.current_game = self.games_list[new_index]
-            self.current_move_index = 0
-            self.update_game_info()
-            self.update_pieces()
+            self._switch_game(current_index, new_index)
 
     def next_game(self):
         """Go to the next game in the list."""
@@ -1199,13 +1423,35 @@ class ChessViewer(tk.Frame):
         
         new_index = current_index[0] + 1
         if new_index < len(self.games_list):
-            self.game_listbox.selection_clear(0, tk.END)
-            self.game_listbox.selection_set(new_index)
-            self.game_listbox.see(new_index)
-            self.current_game = self.games_list[new_index]
-            self.current_move_index = 0
-            self.update_game_info()
-            self.update_pieces()
+            self._switch_game(current_index, new_index)
+
+    def _switch_game(self, old_selection, new_index):
+        """Move the listbox selection and load the game once navigation settles."""
+        # Only clear what was selected rather than the whole list
+        for index in old_selection:
+            self.game_listbox.selection_clear(index)
+        self.game_listbox.selection_set(new_index)
+        self.game_listbox.see(new_index)
+        
+        self._cancel_game_switch()
+        self._game_switch_after_id = self.after(
+            GAME_SWITCH_DELAY_MS, self._load_switched_game, new_index
+        )
+
+    def _cancel_game_switch(self):
+        """Drop a pending prev_game/next_game load so it cannot replace a newer choice."""
+        if self._game_switch_after_id:
+            self.after_cancel(self._game_switch_after_id)
+            self._game_switch_after_id = None
+
+    def _load_switched_game(self, index):
+        """Load the game selected by prev_game/next_game."""
+        self._game_switch_after_id = None
+        if index >= len(self.games_list):
+            return
+        self.current_game = self.games_list[index]
+        self.current_move_index = 0
+        self.update_game_info()
 
     def increase_lines(self):
         """Increase the number of analysis lines shown."""
@@ -1305,6 +1551,12 @@ class ChessViewer(tk.Frame):
         )
         self.moves_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         moves_scroll.config(command=self.moves_text.yview)
+        self.moves_text.tag_bind("move", "<Button-1>", self.move_clicked)
+        self.moves_text.tag_configure(
+            "current_move",
+            background=theme['highlight_bg'],
+            foreground=theme['highlight_fg']
+        )
         
         # Initialize move positions dictionary
         self.move_positions = {}
@@ -1315,28 +1567,10 @@ class ChessViewer(tk.Frame):
             if not self.current_game:
                 return
                 
-            # Get moves based on game type
-            moves = []
-            if isinstance(self.current_game, tuple):
-                pgn_str = self.current_game[11]  # pgn column
-                if pgn_str:
-                    game = chess.pgn.read_game(io.StringIO(pgn_str))
-                    if game:
-                        moves = list(game.mainline_moves())
-            else:
-                # PGN game
-                moves = list(self.current_game.mainline_moves())
-                
             # Check if we can move forward
-            if self.current_move_index < len(moves):
-                # Reset board and replay moves up to new position
-                self.board = chess.Board()
-                for i in range(self.current_move_index + 1):
-                    self.board.push(moves[i])
-                    
+            if self.current_move_index < len(self.moves):
                 self.current_move_index += 1
                 self.update_pieces()
-                self.update_moves_display()
                 
         except Exception as e:
             logger.error(f"Error in next_ply: {e}")
@@ -1347,25 +1581,8 @@ class ChessViewer(tk.Frame):
             if not self.current_game or self.current_move_index <= 0:
                 return
                 
-            # Get moves based on game type
-            moves = []
-            if isinstance(self.current_game, tuple):
-                pgn_str = self.current_game[11]
-                if pgn_str:
-                    game = chess.pgn.read_game(io.StringIO(pgn_str))
-                    if game:
-                        moves = list(game.mainline_moves())
-            else:
-                moves = list(self.current_game.mainline_moves())
-                
-            # Reset board and replay moves up to new position
-            self.board = chess.Board()
             self.current_move_index -= 1
-            for i in range(self.current_move_index):
-                self.board.push(moves[i])
-                
             self.update_pieces()
-            self.update_moves_display()
             
         except Exception as e:
             logger.error(f"Error in prev_ply: {e}")
@@ -1416,12 +1633,8 @@ class ChessViewer(tk.Frame):
             os.makedirs(engines_dir)  # Create the directory if it doesn't exist
             return
         
-        engine_paths = []
-        for root, _, files in os.walk(engines_dir):
-            for file in files:
-                if file.endswith('.exe'):
-                    full_path = os.path.join(root, file)
-                    engine_paths.append(full_path)
+        # Scanned once per session and shared with find_default_engine
+        engine_paths = [engine.path for engine in discover_engines()]
         
         # Add each engine to the menu
         for engine_path in sorted(engine_paths):
@@ -1439,11 +1652,12 @@ class ChessViewer(tk.Frame):
             # Stop current engine if running
             if self.engine:
                 self.analyzing = False
+                self._analysis_generation += 1
                 self.engine.quit()
                 self.engine = None
             
             self.engine_path = engine_path
-            self.initialize_engine()
+            self._warm_engine()
             
             # Update menu selection
             self.selected_engine.set(engine_path)
@@ -1494,15 +1708,12 @@ class ChessViewer(tk.Frame):
             os.makedirs(engines_dir)
             return
         
-        engine_paths = []
+        engine_paths = [engine.path for engine in discover_engines()]
         # First, look for Stockfish
-        for root, _, files in os.walk(engines_dir):
-            for file in files:
-                if file.lower().startswith('stockfish') and file.endswith('.exe'):
-                    self.select_specific_engine(os.path.join(root, file))
-                    return
-                if file.endswith('.exe'):
-                    engine_paths.append(os.path.join(root, file))
+        for engine_path in engine_paths:
+            if os.path.basename(engine_path).lower().startswith('stockfish'):
+                self.select_specific_engine(engine_path)
+                return
         
         # If Stockfish not found, use most recent engine
         if engine_paths:
@@ -1512,8 +1723,12 @@ class ChessViewer(tk.Frame):
     def on_closing(self):
         """Clean up resources and quit."""
         try:
+            # An engine still starting up will see this and shut itself down
+            self.engine_path = None
+            self._engine_token += 1
             if self.engine:
                 self.analyzing = False
+                self._analysis_generation += 1
                 self.engine.quit()
                 self.engine = None
         except Exception as e:
@@ -1605,40 +1820,30 @@ class ChessViewer(tk.Frame):
             
             for game in [self.games_list[i] for i in selected_indices]:
                 try:
-                    # Use the dictionary data directly
-                    if isinstance(game, dict):
-                        game_data = {
-                            'event': game.get('Event', '?'),
-                            'site': game.get('Site', '?'),
-                            'date': game.get('Date', '?'),
-                            'round': game.get('Round', '?'),
-                            'white': game.get('White', 'Unknown'),
-                            'black': game.get('Black', 'Unknown'),
-                            'result': game.get('Result', '?'),
-                            'white_elo': parse_elo(game.get('WhiteElo', '0')),
-                            'black_elo': parse_elo(game.get('BlackElo', '0')),
-                            'eco': game.get('ECO', '?'),
-                            'pgn': game.get('pgn', '')
-                        }
+                    # Parsed games already carry their headers
+                    if isinstance(game, chess.pgn.Game):
+                        game_obj = game
+                        pgn_text = str(game)
                     else:
-                        # Fallback for non-dictionary games
+                        # Fallback for other game types
                         pgn_text = str(game)
                         game_obj = chess.pgn.read_game(io.StringIO(pgn_text))
-                        if game_obj:
-                            headers = game_obj.headers
-                            game_data = {
-                                'event': headers.get('Event', '?'),
-                                'site': headers.get('Site', '?'),
-                                'date': headers.get('Date', '?'),
-                                'round': headers.get('Round', '?'),
-                                'white': headers.get('White', 'Unknown'),
-                                'black': headers.get('Black', 'Unknown'),
-                                'result': headers.get('Result', '?'),
-                                'white_elo': parse_elo(headers.get('WhiteElo', '0')),
-                                'black_elo': parse_elo(headers.get('BlackElo', '0')),
-                                'eco': headers.get('ECO', '?'),
-                                'pgn': pgn_text
-                            }
+                    
+                    if game_obj:
+                        headers = game_obj.headers
+                        game_data = {
+                            'event': headers.get('Event', '?'),
+                            'site': headers.get('Site', '?'),
+                            'date': headers.get('Date', '?'),
+                            'round': headers.get('Round', '?'),
+                            'white': headers.get('White', 'Unknown'),
+                            'black': headers.get('Black', 'Unknown'),
+                            'result': headers.get('Result', '?'),
+                            'white_elo': parse_elo(headers.get('WhiteElo', '0')),
+                            'black_elo': parse_elo(headers.get('BlackElo', '0')),
+                            'eco': headers.get('ECO', '?'),
+                            'pgn': pgn_text
+                        }
                 
                     print("\n=== Game Data to be Added ===")
                     print(f"White: {game_data['white']}")
@@ -1671,51 +1876,71 @@ class ChessViewer(tk.Frame):
             logger.error(error_msg)
             messagebox.showerror("Error", error_msg)
 
+    def _fill_listbox(self, items):
+        """Append display strings to the game listbox with as few Tcl calls as possible."""
+        for start in range(0, len(items), LISTBOX_INSERT_CHUNK):
+            if start:
+                self.update_idletasks()
+            self.game_listbox.insert(tk.END, *items[start:start + LISTBOX_INSERT_CHUNK])
+
     def update_games_list(self):
         """Update the games listbox with current games."""
         self.game_listbox.delete(0, tk.END)
-        for game in self.games_list:
-            game_str = format_game_display(game)
-            self.game_listbox.insert(tk.END, game_str)
+        self._fill_listbox([format_game_display(game) for game in self.games_list])
         
         # Select and load the first game if available
         if self.games_list:
             self.game_listbox.selection_set(0)
             self.current_game = self.games_list[0]
             self.current_move_index = 0
-            self.update_game_info()
-            self.update_pieces()
+            self.update_game_info()  # Also draws the pieces
 
     def add_games_to_list(self, games):
         """Add games to the list and listbox."""
         try:
-            logger.info(f"Adding {len(games) if games else 0} games to list")
+            self._cancel_game_switch()
             self.game_listbox.delete(0, tk.END)
             self.games_list.clear()
+            self._game_cache.clear()
             
+            pending = []  # Display strings not yet in the listbox
             for game in games:
-                self.games_list.append(game)
+                # Normalise move-string dicts to parsed games once, at ingest
+                if isinstance(game, dict):
+                    game = self.parse_pgn_moves(game)
+                    if game is None:
+                        continue
                 
                 # For PGN-sourced games (chess.pgn.Game objects)
                 if isinstance(game, chess.pgn.Game):
                     white = game.headers.get('White', '?')
                     black = game.headers.get('Black', '?')
                     result = game.headers.get('Result', '?')
-                    display_text = f"{white} vs {black} ({result})"
+                    display_text = game_list_text(white, black, result)
                     
                 # For database-sourced games (tuples)
                 elif isinstance(game, tuple):
                     white = game[-2]  # white_name from JOIN
                     black = game[-1]  # black_name from JOIN
                     result = game[7]  # result column
-                    display_text = f"{white} vs {black} ({result})"
+                    display_text = game_list_text(white, black, result)
                     
                 else:
                     logger.warning(f"Unknown game format: {type(game)}")
                     logger.warning(f"Game data: {game}")
                     continue
                     
-                self.game_listbox.insert(tk.END, display_text)
+                self.games_list.append(game)
+                pending.append(display_text)
+                
+                # Flush in batches, keeping the UI responsive while long files load
+                if len(pending) >= LISTBOX_BATCH_SIZE:
+                    self.game_listbox.insert(tk.END, *pending)
+                    pending.clear()
+                    self.update_idletasks()
+            
+            if pending:
+                self.game_listbox.insert(tk.END, *pending)
                 
             logger.info(f"Added {len(self.games_list)} games to list")
             
@@ -1724,13 +1949,13 @@ class ChessViewer(tk.Frame):
                 self.game_listbox.selection_set(0)
                 self.current_game = self.games_list[0]
                 self.current_move_index = 0
-                self.update_game_info()
-                self.update_pieces()
+                self.update_game_info()  # Also draws the pieces
                 
         except Exception as e:
             logger.error(f"Error adding games to list: {e}")
 
 if __name__ == "__main__":
+    configure_logging()
     root = tk.Tk()
     app = ChessViewer(root)
     try:
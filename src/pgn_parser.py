@@ -1,75 +1,357 @@
 import chess.pgn
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict, Optional
 import logging
 import io
+import mmap
+import os
+import re
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('chess_parser.log'),
-        logging.StreamHandler()
-    ]
-)
+# Logging is configured by the application, not on import
 logger = logging.getLogger(__name__)
 
+# Used by non-verbose parsers: progress messages stop at the level check,
+# warnings and errors still propagate
+_quiet_logger = logging.getLogger(f"{__name__}.quiet")
+_quiet_logger.setLevel(logging.WARNING)
+
+# A PGN tag pair, e.g. [White "Carlsen, Magnus"]; the value runs to the last quote,
+# so escaped quotes inside it are kept
+_HEADER_RE = re.compile(r'^\[(\S+)\s+"(.*)"\]\s*$')
+_HEADER_BYTES_RE = re.compile(rb'^\[(\S+)\s+"(.*)"\]\s*$')
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# Movetext ending in one of these is complete
+_RESULT_TOKENS = (b'1-0', b'0-1', b'1/2-1/2', b'*')
+
+# Characters that open or close comments in movetext
+_COMMENT_CHARS_RE = re.compile(rb'[{};]')
+
+# A blank line followed by a tag pair, i.e. the start of the next game
+_GAME_BOUNDARY_RE = re.compile(rb'\r?\n\r?\n(?=\[)')
+
+# Files smaller than this are parsed serially; process start-up would dominate
+PARALLEL_MIN_BYTES = 1 << 20
+
+# Byte ranges handed out per worker, so a slow range does not leave cores idle
+PARALLEL_CHUNKS_PER_WORKER = 4
+
+def _split_pgn_bytes(data, parts: int) -> List[tuple[int, int]]:
+    """Split PGN bytes into about `parts` (start, end) ranges on game boundaries."""
+    size = len(data)
+    bounds = [0]
+    for i in range(1, parts):
+        target = max(size * i // parts, bounds[-1])
+        match = _GAME_BOUNDARY_RE.search(data, target)
+        # A blank line then "[" inside a comment, e.g. "[%clk ...]", is not a boundary
+        while match and _closes_comment_next(data, match.end()):
+            match = _GAME_BOUNDARY_RE.search(data, match.end())
+        if not match:
+            break
+        if match.end() > bounds[-1]:
+            bounds.append(match.end())
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+def _closes_comment_next(data, pos: int) -> bool:
+    """Return whether the next brace after `pos` is a '}', i.e. `pos` is inside a {...} comment.
+
+    A local check for picking split points in the middle of a file, where the
+    comment state is unknown; iter_game_texts tracks it exactly instead.
+    """
+    close = data.find(b'}', pos)
+    if close < 0:
+        return False
+    opening = data.find(b'{', pos, close)
+    return opening < 0
+
+def _comment_open_at(data, start: int, end: int, in_comment: bool) -> bool:
+    """Return whether a {...} comment is open at `end`, given its state at line start `start`."""
+    if not in_comment and data.find(b'{', start, end) < 0:
+        return False
+    for line in data[start:end].split(b'\n'):
+        line = line.strip()
+        # Tag values and escape lines may hold braces; they only count inside a comment
+        if not in_comment and (line.startswith(b'%') or _HEADER_BYTES_RE.match(line)):
+            continue
+        in_comment = _in_comment_after(line, in_comment)
+    return in_comment
+
+def _iter_game_starts(data, pos: int):
+    """Yield the offset of each game start after `pos`, skipping blank lines inside comments."""
+    in_comment = False
+    for match in _GAME_BOUNDARY_RE.finditer(data, pos):
+        in_comment = _comment_open_at(data, pos, match.start(), in_comment)
+        pos = match.start()
+        if not in_comment:
+            yield match.end()
+
+@contextmanager
+def _map_pgn(filename: str):
+    """Map a PGN file read-only; yields None for an empty file, which mmap cannot map."""
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield None
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _bom_length(mm) -> int:
+    """Return the length of a UTF-8 byte order mark at the start of mapped data."""
+    return len(_UTF8_BOM) if mm[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+
+def _split_pgn(filename: str, parts: int) -> List[tuple[int, int]]:
+    """Split a PGN file into about `parts` (start, end) byte ranges without parsing it."""
+    with _map_pgn(filename) as mm:
+        if mm is None:
+            return []
+        return _split_pgn_bytes(mm, parts)
+
+def _in_comment_after(line: bytes, in_comment: bool) -> bool:
+    """Return whether a {...} comment is still open at the end of a movetext line."""
+    for match in _COMMENT_CHARS_RE.finditer(line):
+        char = match.group()
+        if in_comment:
+            in_comment = char != b'}'
+        elif char == b'{':
+            in_comment = True
+        elif char == b';':
+            break  # The rest of the line is a comment
+    return in_comment
+
+def _read_pgn_text(filename: str) -> str:
+    """Read a whole PGN file through mmap and decode it in one go."""
+    with _map_pgn(filename) as mm:
+        if mm is None:
+            return ''
+        return mm[:].decode('utf-8-sig', errors='replace')
+
+def _parse_chunk(filename: str, start: int, end: int) -> List[tuple[Dict[str, str], List[chess.Move]]]:
+    """Parse the games in one byte range of a PGN file (process pool worker).
+
+    Returns headers and mainline moves rather than Game objects, whose
+    linked node tree is too deep to pickle for long games.
+    """
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8-sig', errors='replace')
+    
+    games = []
+    pgn = io.StringIO(text)
+    while True:
+        game = chess.pgn.read_game(pgn)
+        if game is None:
+            break
+        games.append((dict(game.headers), list(game.mainline_moves())))
+    return games
+
+def _build_game(headers: Dict[str, str], moves: List[chess.Move]) -> chess.pgn.Game:
+    """Rebuild a mainline-only Game from headers and moves."""
+    game = chess.pgn.Game(headers)
+    node = game
+    for move in moves:
+        node = node.add_main_variation(move)
+    return game
+
+class MovesOnlyVisitor(chess.pgn.BaseVisitor):
+    """Visitor that collects mainline moves and skips everything else."""
+
+    def begin_game(self):
+        self.moves: List[chess.Move] = []
+
+    def begin_variation(self):
+        return chess.pgn.SKIP
+
+    def visit_move(self, board: chess.Board, move: chess.Move):
+        self.moves.append(move)
+
+    def handle_error(self, error: Exception):
+        # Like GameBuilder: keep the moves before a bad one instead of raising;
+        # read_game skips the rest of the line after an error
+        logger.error(f"Error in PGN movetext: {error}")
+
+    def result(self) -> List[chess.Move]:
+        return self.moves
+
 class PGNParser:
     """Parser for PGN chess game files."""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.games: List[Dict] = []
         self.errors: List[str] = []
+        self.logger = logger if verbose else _quiet_logger
+
+    def parse_file(self, filename, headers_only=False):
+        """Parse a PGN file and return list of games.
+        
+        With headers_only, return each game's chess.pgn.Headers instead; the
+        move text is skipped without being parsed.
+        """
+        try:
+            # The whole list is built anyway, so read and decode the file at once
+            pgn = io.StringIO(_read_pgn_text(filename))
+            return list(self._read_games(pgn, filename, headers_only))
+            
+        except Exception as e:
+            self.errors.append(f"Error parsing file {filename}: {str(e)}")
+            self.logger.error(f"Error parsing PGN file: {e}")
+            return None
 
-    def parse_file(self, filename):
-        """Parse a PGN file and return list of games."""
+    def iter_games(self, filename, headers_only=False):
+        """Yield games from a PGN file one at a time, holding only the current one in memory."""
         try:
-            with open(filename, encoding='utf-8-sig') as pgn:
-                games = []
-                while True:
-                    game = chess.pgn.read_game(pgn)
-                    if game is None:
-                        break
-                    # Return the chess.pgn.Game object directly
-                    games.append(game)
+            # Same decoding policy as _read_pgn_text: bad bytes never end the file early
+            with open(filename, encoding='utf-8-sig', errors='replace', buffering=1 << 20) as pgn:
+                yield from self._read_games(pgn, filename, headers_only)
                 
-                logger.info(f"Successfully parsed {len(games)} games from {filename}")
-                return games
+        except Exception as e:
+            self.errors.append(f"Error parsing file {filename}: {str(e)}")
+            self.logger.error(f"Error parsing PGN file: {e}")
+
+    def iter_headers(self, filename):
+        """Yield the headers of each game in a PGN file without parsing any moves."""
+        return self.iter_games(filename, headers_only=True)
+
+    def _read_games(self, pgn, filename, headers_only=False):
+        """Yield chess.pgn.Game objects, or only their headers, from an open text stream."""
+        read = chess.pgn.read_headers if headers_only else chess.pgn.read_game
+        count = 0
+        while True:
+            game = read(pgn)
+            if game is None:
+                break
+            count += 1
+            # Yield the chess.pgn.Game object directly
+            yield game
+        
+        self.logger.info(f"Successfully parsed {count} games from {filename}")
+
+    def iter_game_texts(self, filename):
+        """Yield the PGN text of each game, split on game boundaries without parsing.
+        
+        Pairs with parse_game for callers that store the original text.
+        """
+        try:
+            with _map_pgn(filename) as mm:
+                if mm is None:
+                    return
                 
+                # One regex pass over the mapped file finds every game start
+                bounds = [_bom_length(mm)]
+                bounds += _iter_game_starts(mm, bounds[0])
+                bounds.append(len(mm))
+                for start, end in zip(bounds, bounds[1:]):
+                    # Leading or trailing blank lines leave empty slices
+                    text = mm[start:end]
+                    if text.strip():
+                        yield text.decode('utf-8', errors='replace')
+                        
         except Exception as e:
             self.errors.append(f"Error parsing file {filename}: {str(e)}")
-            logger.error(f"Error parsing PGN file: {e}")
+            self.logger.error(f"Error parsing PGN file: {e}")
+
+    def parse_file_raw(self, filename):
+        """Parse a PGN file into game dicts holding the raw movetext; no moves are parsed."""
+        error_count = len(self.errors)
+        games = []
+        for headers, movetext in self.iter_raw_games(filename):
+            game_dict = self._create_game_dict(headers, [movetext])
+            if game_dict:
+                games.append(game_dict)
+        if len(self.errors) > error_count:
             return None
+        return games
 
-    def _parse_header_line(self, line: str) -> tuple[Optional[str], Optional[str]]:
-        """Parse a single header line."""
+    def iter_raw_games(self, filename):
+        """Yield (headers, movetext) for each game, splitting the raw bytes without chess.pgn."""
         try:
-            if ']' not in line:
-                return None, None
+            with _map_pgn(filename) as mm:
+                if mm is None:
+                    return
+                mm.seek(_bom_length(mm))
                 
-            # Extract tag and value
-            tag_start = line.find('[') + 1
-            tag_end = line.find(' ')
-            value_start = line.find('"') + 1
-            value_end = line.rfind('"')
-            
-            if tag_end > tag_start and value_end > value_start:
-                tag = line[tag_start:tag_end]
-                value = line[value_start:value_end]
-                return tag, value
+                count = 0
+                headers = {}
+                moves = []
+                in_comment = False  # Inside a {...} comment spanning lines
+                for line in iter(mm.readline, b''):
+                    line = line.strip()
+                    if not line:
+                        # A blank line ends the game once its result has been seen
+                        if not in_comment and moves and moves[-1].endswith(_RESULT_TOKENS):
+                            yield headers, b'\n'.join(moves).decode('utf-8', errors='replace')
+                            count += 1
+                            headers, moves = {}, []
+                        continue
+                    
+                    # Wrapped movetext can start a line with "[", e.g. "[%clk ...]" in a comment
+                    match = None if in_comment else _HEADER_BYTES_RE.match(line)
+                    if match:
+                        if moves:
+                            # Next game started without a blank line or result
+                            yield headers, b'\n'.join(moves).decode('utf-8', errors='replace')
+                            count += 1
+                            headers, moves = {}, []
+                        headers[match.group(1).decode('ascii', errors='replace')] = \
+                            match.group(2).decode('utf-8', errors='replace')
+                    elif in_comment or not line.startswith((b'%', b';')):
+                        moves.append(line)
+                        in_comment = _in_comment_after(line, in_comment)
+                
+                if headers or moves:
+                    yield headers, b'\n'.join(moves).decode('utf-8', errors='replace')
+                    count += 1
+                
+                self.logger.info(f"Successfully parsed {count} games from {filename}")
                 
         except Exception as e:
-            logger.debug(f"Failed to parse header line '{line}': {e}")
-        
+            self.errors.append(f"Error parsing file {filename}: {str(e)}")
+            self.logger.error(f"Error parsing PGN file: {e}")
+
+    def parse_file_parallel(self, filename, workers=None):
+        """Parse a PGN file across a process pool and return list of games.
+
+        The file is split on game boundaries and each range is parsed in its
+        own process. Games come back with headers and mainline moves only;
+        comments and variations are dropped.
+        """
+        try:
+            if os.path.getsize(filename) < PARALLEL_MIN_BYTES:
+                return self.parse_file(filename)
+            
+            workers = workers or os.cpu_count() or 1
+            chunks = _split_pgn(filename, workers * PARALLEL_CHUNKS_PER_WORKER)
+            starts, ends = zip(*chunks)
+            
+            games = []
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # map keeps the games in file order
+                for chunk_games in pool.map(_parse_chunk, [filename] * len(chunks), starts, ends):
+                    for headers, moves in chunk_games:
+                        games.append(_build_game(headers, moves))
+            
+            self.logger.info(f"Successfully parsed {len(games)} games from {filename}")
+            return games
+            
+        except Exception as e:
+            self.errors.append(f"Error parsing file {filename}: {str(e)}")
+            self.logger.error(f"Error parsing PGN file: {e}")
+            return None
+
+    def _parse_header_line(self, line: str) -> tuple[Optional[str], Optional[str]]:
+        """Parse a single header line."""
+        match = _HEADER_RE.match(line)
+        if match:
+            return match.group(1, 2)
         return None, None
 
     def _create_game_dict(self, headers: Dict[str, str], moves: List[str]) -> Optional[Dict]:
         """Create a game dictionary from headers and moves."""
         try:
-            # Clean and join moves, preserving the PGN format
+            # Join moves, preserving the PGN format; the movetext reader ignores extra whitespace
             moves_str = ' '.join(moves)
-            # Clean up extra whitespace but preserve the moves
-            moves_str = ' '.join(moves_str.split())
             
             # Create game dictionary with required fields
             game_dict = {
@@ -88,23 +370,23 @@ class PGNParser:
             
             # Basic validation
             if not moves_str or moves_str.isspace():
-                logger.warning(f"No moves found for game: {game_dict['White']} vs {game_dict['Black']}")
+                self.logger.warning(f"No moves found for game: {game_dict['White']} vs {game_dict['Black']}")
                 return None
                 
-            logger.debug(f"Created game: {game_dict['White']} vs {game_dict['Black']} with moves: {moves_str[:50]}...")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Created game: {game_dict['White']} vs {game_dict['Black']} with moves: {moves_str[:50]}...")
             return game_dict
             
         except Exception as e:
-            logger.error(f"Failed to create game dictionary: {e}")
+            self.logger.error(f"Failed to create game dictionary: {e}")
             return None
 
     def parse_game(self, pgn_text):
         """Parse a single game from PGN text."""
         try:
-            game = chess.pgn.read_game(io.StringIO(pgn_text))
-            if game:
-                # Extract headers
-                headers = game.headers
+            # Only the tag pairs are used, so stop before the movetext
+            headers = chess.pgn.read_headers(io.StringIO(pgn_text))
+            if headers is not None:
                 return {
                     'event': headers.get('Event', '?'),
                     'site': headers.get('Site', '?'),
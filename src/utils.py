@@ -1,21 +1,87 @@
+import ctypes
+import functools
+import logging
 import os
+import sys
+from collections import namedtuple
 
+# An engine found by discover_engines; immutable so the cached scan can be shared
+Engine = namedtuple('Engine', ['name', 'path'])
+
+def configure_logging(path='chess_parser.log', level=logging.INFO):
+    """Send log records to a file and the console; only the first call has any effect."""
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for handler in (logging.FileHandler(path), logging.StreamHandler()):
+        handler.setFormatter(formatter)
+        root_logger.addHandler(handler)
+    root_logger.setLevel(level)
+
+@functools.lru_cache(maxsize=1)
 def discover_engines():
-    """Discover all engine executables recursively in the res/engines folder and its subdirectories."""
+    """Discover all engine executables recursively in the res/engines folder and its subdirectories.
+    
+    Returns a tuple of Engine(name, path). The result is cached for the session;
+    call discover_engines.cache_clear() to rescan.
+    """
     engine_dir = os.path.join('res', 'engines')
     engines = []
     
     if os.path.exists(engine_dir):
-        for root, dirs, files in os.walk(engine_dir):
-            for file in files:
-                if file.endswith('.exe'):
-                    engine_path = os.path.join(root, file)
-                    # Create name from relative path, replacing directory separators with spaces
-                    rel_path = os.path.relpath(engine_path, engine_dir)
-                    name = os.path.splitext(rel_path)[0].replace(os.sep, ' ')
-                    engines.append({
-                        'name': name,
-                        'path': engine_path
-                    })
+        # scandir entries carry their type, so no extra stat per file
+        stack = [engine_dir]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.exe'):
+                        # Create name from relative path, replacing directory separators with spaces
+                        rel_path = os.path.relpath(entry.path, engine_dir)
+                        name = os.path.splitext(rel_path)[0].replace(os.sep, ' ')
+                        engines.append(Engine(name, entry.path))
+    
+    return tuple(engines)
+
+def available_memory_mb():
+    """Return the available physical memory in MB, or None if it can't be determined."""
+    if sys.platform == 'win32':
+        return _windows_available_memory_mb()
+    
+    try:
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        try:
+            pages = os.sysconf('SC_AVPHYS_PAGES')
+        except (ValueError, OSError):
+            # macOS only reports total memory; callers use a capped fraction of it
+            pages = os.sysconf('SC_PHYS_PAGES')
+        return pages * page_size // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def _windows_available_memory_mb():
+    """Return the available physical memory in MB via GlobalMemoryStatusEx."""
+    class MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [
+            ('dwLength', ctypes.c_ulong),
+            ('dwMemoryLoad', ctypes.c_ulong),
+            ('ullTotalPhys', ctypes.c_ulonglong),
+            ('ullAvailPhys', ctypes.c_ulonglong),
+            ('ullTotalPageFile', ctypes.c_ulonglong),
+            ('ullAvailPageFile', ctypes.c_ulonglong),
+            ('ullTotalVirtual', ctypes.c_ulonglong),
+            ('ullAvailVirtual', ctypes.c_ulonglong),
+            ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+        ]
     
-    return engines
\ No newline at end of file
+    try:
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return None
+        return status.ullAvailPhys // (1024 * 1024)
+    except (AttributeError, OSError):
+        return None
@@ -0,0 +1,113 @@
+import io
+import os
+import tempfile
+import unittest
+
+import chess.pgn
+
+from src.pgn_parser import MovesOnlyVisitor, PGNParser, _split_pgn_bytes
+
+WRAPPED_CLOCK_PGN = """[Event "Wrapped"]
+[White "A"]
+[Black "B"]
+[Result "1-0"]
+
+1. e4 {
+[%clk 0:01:00] } e5 2. Nf3 {a long comment that
+
+spans a blank line} Nc6 3. Bb5 1-0
+
+[Event "Second"]
+[White "C"]
+[Black "D"]
+[Result "*"]
+
+1. d4 ; line comment with { brace
+d5 2. c4 *
+"""
+
+
+class PGNFileTestCase(unittest.TestCase):
+
+    def _write(self, text):
+        fd, path = tempfile.mkstemp(suffix='.pgn')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        self.addCleanup(os.remove, path)
+        return path
+
+
+class IterRawGamesTest(PGNFileTestCase):
+    """iter_raw_games must split files the same way as parse_file."""
+
+    def assertMatchesParseFile(self, path):
+        parser = PGNParser()
+        games = parser.parse_file(path)
+        raw_games = list(parser.iter_raw_games(path))
+        self.assertEqual(parser.errors, [])
+        self.assertEqual(len(raw_games), len(games))
+        
+        for game, (headers, movetext) in zip(games, raw_games):
+            self.assertEqual(headers, {key: game.headers[key] for key in headers})
+            reparsed = chess.pgn.read_game(io.StringIO(movetext))
+            self.assertEqual(list(reparsed.mainline_moves()), list(game.mainline_moves()))
+
+    def test_wrapped_comments(self):
+        self.assertMatchesParseFile(self._write(WRAPPED_CLOCK_PGN))
+
+    def test_bom_and_leading_blank_line(self):
+        self.assertMatchesParseFile(self._write('﻿\n' + WRAPPED_CLOCK_PGN))
+
+    def test_sample_file(self):
+        self.assertMatchesParseFile(os.path.join(os.path.dirname(__file__), '..', 'out_kicsi.pgn'))
+
+    def test_empty_file(self):
+        self.assertEqual(list(PGNParser().iter_raw_games(self._write(''))), [])
+
+
+class IterGameTextsTest(PGNFileTestCase):
+    """iter_game_texts must yield one parseable text per game."""
+
+    def test_leading_and_trailing_blank_lines(self):
+        path = self._write('\n\n' + WRAPPED_CLOCK_PGN + '\n\n')
+        parser = PGNParser()
+        texts = list(parser.iter_game_texts(path))
+        self.assertEqual(len(texts), len(parser.parse_file(path)))
+        self.assertEqual([parser.parse_game(text)['white'] for text in texts], ['A', 'C'])
+
+    def test_blank_line_then_tag_in_comment(self):
+        path = self._write(
+            '[Event "A"]\n[White "A"]\n\n1. e4 {note\n\n[%clk 0:01:00]} e5 1-0\n\n'
+            '[Event "B"]\n[White "B"]\n\n1. d4 d5 0-1\n'
+        )
+        parser = PGNParser()
+        texts = list(parser.iter_game_texts(path))
+        self.assertEqual([parser.parse_game(text)['white'] for text in texts], ['A', 'B'])
+        self.assertIn('[%clk 0:01:00]} e5 1-0', texts[0])
+
+    def test_empty_file(self):
+        self.assertEqual(list(PGNParser().iter_game_texts(self._write(''))), [])
+
+
+class SplitPGNBytesTest(unittest.TestCase):
+
+    def test_no_split_inside_comment(self):
+        data = (
+            b'[White "A"]\n\n1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 4. Ba4 Nf6 {note\n\n[%clk 0:01:00]} 5. O-O 1-0\n\n'
+            b'[White "B"]\n\n1. d4 0-1\n'
+        )
+        self.assertLess(len(data) // 2, data.index(b'[%clk'))
+        second = data.index(b'[White "B"]')
+        self.assertEqual(_split_pgn_bytes(data, 2), [(0, second), (second, len(data))])
+
+
+class MovesOnlyVisitorTest(unittest.TestCase):
+
+    def test_illegal_move_keeps_earlier_moves(self):
+        with self.assertLogs('src.pgn_parser', level='ERROR'):
+            moves = chess.pgn.read_game(io.StringIO('1. e4 e5 2. Qxh7 Nc6 *'), Visitor=MovesOnlyVisitor)
+        self.assertEqual(moves, [chess.Move.from_uci('e2e4'), chess.Move.from_uci('e7e5')])
+
+
+if __name__ == '__main__':
+    unittest.main()